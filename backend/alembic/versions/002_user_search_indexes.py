@@ -0,0 +1,40 @@
+"""User listing search and filter indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+# Columns searched with ILIKE '%term%' by the user listing endpoint
+TRGM_COLUMNS = ("first_name", "last_name", "email", "company_name")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index(
+        "ix_users_role_is_active", "users", ["role", "is_active"], unique=False
+    )
+    for column in TRGM_COLUMNS:
+        op.create_index(
+            f"ix_users_{column}_trgm",
+            "users",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(TRGM_COLUMNS):
+        op.drop_index(f"ix_users_{column}_trgm", table_name="users")
+    op.drop_index("ix_users_role_is_active", table_name="users")
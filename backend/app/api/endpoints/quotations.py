@@ -14,6 +14,7 @@ from app.core.auth import RoleChecker
 from app.models.user import User
 from app.schemas.quotation import (
     Quotation,
+    QuotationBulkStatusUpdate,
     QuotationCreate,
     QuotationItem,
     QuotationItemCreate,
@@ -30,11 +31,17 @@ from app.schemas.quotation import (
     SupplierCreate,
     SupplierUpdate,
 )
+from app.services.notification_service import NotificationService
 from app.services.quotation_service import QuotationService
 
 router = APIRouter()
 
 
+def get_notification_service(db: Session = Depends(get_db)) -> NotificationService:
+    """Dependency to get notification service."""
+    return NotificationService(db)
+
+
 # Quotation CRUD Endpoints
 @router.get("/", response_model=QuotationSearchResponse)
 async def list_quotations(
@@ -82,6 +89,47 @@ async def create_quotation(
     return quotation_service.create_quotation(quotation_data, current_user.id)
 
 
+@router.put("/bulk")
+async def bulk_update_quotations(
+    bulk_data: QuotationBulkStatusUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Atualizar o status de várias cotações de uma vez."""
+    quotation_service = QuotationService(db)
+    updated_count = quotation_service.bulk_update_status(
+        bulk_data.quotation_ids, bulk_data.status
+    )
+    return {"updated_count": updated_count}
+
+
+@router.get("/analytics")
+async def get_quotation_analytics(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Obter total de cotações e distribuição por status."""
+    quotation_service = QuotationService(db)
+    return quotation_service.get_quotation_analytics()
+
+
+@router.post("/check-deadlines")
+async def check_quotation_deadlines(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    notification_service: NotificationService = Depends(get_notification_service),
+    days: int = Query(7, ge=1, le=30, description="Janela de aviso em dias"),
+):
+    """Enviar lembretes para cotações com prazo próximo."""
+    quotation_service = QuotationService(db)
+    due_quotations = quotation_service.get_quotations_due_soon(days=days)
+
+    for quotation in due_quotations:
+        await notification_service.send_deadline_reminder(quotation)
+
+    return {"notifications_sent": len(due_quotations)}
+
+
 @router.get("/{quotation_id}", response_model=Quotation)
 async def get_quotation(
     quotation_id: UUID,
@@ -24,6 +24,9 @@ from app.schemas.user import (
     PermissionResponse,
     PermissionUpdate,
     UserAdminUpdate,
+    UserBulkAction,
+    UserBulkRoleUpdate,
+    UserBulkUpdate,
     UserListResponse,
     UserProfile,
     UserResponse,
@@ -121,6 +124,109 @@ async def get_users(
         )
 
 
+# Bulk endpoints are declared before the /{user_id} routes they would shadow
+@router.put("/bulk")
+async def bulk_update_users(
+    bulk_data: UserBulkUpdate,
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db),
+):
+    """Apply the same update to several users (admin only)."""
+    try:
+        user_service = UserService(db)
+        updated_count = user_service.bulk_update_users(
+            bulk_data.user_ids,
+            bulk_data.updates.dict(exclude_unset=True),
+            current_user.id,
+        )
+        return {"updated_count": updated_count}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erro interno do servidor",
+        )
+
+
+@router.put("/bulk/role")
+async def bulk_assign_role(
+    bulk_data: UserBulkRoleUpdate,
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db),
+):
+    """Assign one role to several users (admin only)."""
+    try:
+        user_service = UserService(db)
+        updated_count = user_service.bulk_update_users(
+            bulk_data.user_ids, {"role": bulk_data.role}, current_user.id
+        )
+        return {"updated_count": updated_count}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erro interno do servidor",
+        )
+
+
+@router.put("/bulk/deactivate")
+async def bulk_deactivate_users(
+    bulk_data: UserBulkAction,
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db),
+):
+    """Deactivate several user accounts (admin only)."""
+    try:
+        user_service = UserService(db)
+        updated_count = user_service.bulk_update_users(
+            bulk_data.user_ids, {"is_active": False}, current_user.id
+        )
+        return {"updated_count": updated_count}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erro interno do servidor",
+        )
+
+
+@router.put("/bulk/activate")
+async def bulk_reactivate_users(
+    bulk_data: UserBulkAction,
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db),
+):
+    """Reactivate several user accounts (admin only)."""
+    try:
+        user_service = UserService(db)
+        updated_count = user_service.bulk_reactivate_users(
+            bulk_data.user_ids, current_user.id
+        )
+        return {"updated_count": updated_count}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erro interno do servidor",
+        )
+
+
+@router.delete("/bulk")
+async def bulk_delete_users(
+    bulk_data: UserBulkAction,
+    current_user: User = Depends(get_current_superuser),
+    db: Session = Depends(get_db),
+):
+    """Soft delete several user accounts (superuser only)."""
+    try:
+        user_service = UserService(db)
+        deleted_count = user_service.bulk_delete_users(
+            bulk_data.user_ids, current_user.id
+        )
+        return {"deleted_count": deleted_count}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erro interno do servidor",
+        )
+
+
 @router.get("/{user_id}", response_model=UserProfile)
 async def get_user(
     user_id: UUID,
@@ -8,7 +8,7 @@ from datetime import datetime
 
 from sqlalchemy import JSON, Boolean, Column, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Integer, String, Table, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Table, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -126,6 +126,10 @@ class User(Base):
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     updated_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
 
+    # User listing filters on role and is_active together; the pg_trgm GIN
+    # indexes for its ILIKE search live in migration 002 only
+    __table_args__ = (Index("ix_users_role_is_active", role, is_active),)
+
     # Relationships
     permissions = relationship(
         "Permission", secondary=user_permissions, back_populates="users"
@@ -80,6 +80,15 @@ class QuotationUpdate(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
+class QuotationBulkStatusUpdate(BaseModel):
+    """Schema for updating the status of several quotations at once."""
+
+    quotation_ids: List[UUID] = Field(
+        ..., min_length=1, description="IDs das cotações a atualizar"
+    )
+    status: QuotationStatus = Field(..., description="Novo status")
+
+
 class QuotationSummary(BaseModel):
     """Summary schema for quotation listings."""
 
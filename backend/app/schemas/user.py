@@ -371,6 +371,26 @@ class UserAdminUpdate(BaseModel):
     is_superuser: Optional[bool] = None
 
 
+class UserBulkAction(BaseModel):
+    """Schema selecting several users for a bulk action."""
+
+    user_ids: List[UUID] = Field(
+        ..., min_length=1, description="IDs dos usuários afetados"
+    )
+
+
+class UserBulkUpdate(UserBulkAction):
+    """Schema for applying the same admin update to several users."""
+
+    updates: UserAdminUpdate
+
+
+class UserBulkRoleUpdate(UserBulkAction):
+    """Schema for assigning one role to several users."""
+
+    role: str = Field(..., pattern=r"^(super_admin|admin|manager|operator|viewer)$")
+
+
 class UserListResponse(BaseModel):
     """Schema for user list response."""
 
@@ -98,7 +98,7 @@ class NotificationService:
                     if expires_hours
                     else None
                 ),
-                metadata=metadata,
+                extra_metadata=metadata,
                 created_by=created_by,
             )
 
@@ -646,6 +646,30 @@ class NotificationService:
             logger.error(f"Error cleaning up expired notifications: {str(e)}")
             return 0
 
+    async def send_deadline_reminder(self, quotation: Any) -> Notification:
+        """Notify the quotation owner that its response deadline is approaching."""
+        deadline = quotation.response_deadline
+        days_remaining = (
+            (deadline.date() - datetime.utcnow().date()).days if deadline else None
+        )
+
+        return await self.create_notification(
+            user_id=quotation.assigned_to_id or quotation.created_by_id,
+            title="Prazo se aproximando",
+            message=f"Atenção: prazo para {quotation.title} se aproxima em breve",
+            category=NotificationCategory.SISTEMA,
+            type=NotificationType.WARNING,
+            priority=NotificationPriority.HIGH,
+            related_type="quotation",
+            related_id=str(quotation.id),
+            action_url=f"/quotations/{quotation.id}",
+            action_text="Ver Detalhes",
+            metadata={
+                "deadline": deadline.isoformat() if deadline else None,
+                "days_remaining": days_remaining,
+            },
+        )
+
 
 # Convenience functions for common notification types
 
@@ -7,7 +7,7 @@ from decimal import Decimal
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, asc, desc, extract, func, or_
+from sqlalchemy import and_, asc, desc, extract, func, or_, update
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.quotation import Quotation as QuotationModel
@@ -97,6 +97,36 @@ class QuotationService:
         self.db.commit()
         return True
 
+    def bulk_update_status(
+        self, quotation_ids: List[UUID], status: QuotationStatus
+    ) -> int:
+        """Update the status of several quotations in a single statement."""
+        stmt = (
+            update(QuotationModel)
+            .where(QuotationModel.id.in_(quotation_ids))
+            .values(status=status, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        result = self.db.execute(stmt)
+        self.db.commit()
+        return result.rowcount
+
+    def get_quotations_due_soon(self, days: int = 7) -> List[QuotationModel]:
+        """Get open quotations whose response deadline falls within the next N days."""
+        now = datetime.utcnow()
+        return (
+            self.db.query(QuotationModel)
+            .filter(
+                QuotationModel.response_deadline.between(
+                    now, now + timedelta(days=days)
+                ),
+                QuotationModel.status.in_(
+                    [QuotationStatus.DRAFT, QuotationStatus.SENT]
+                ),
+            )
+            .all()
+        )
+
     def search_quotations(
         self, search_params: QuotationSearchParams
     ) -> QuotationSearchResponse:
@@ -424,6 +454,21 @@ class QuotationService:
 
         return {status.value: count for status, count in status_counts}
 
+    def get_quotation_analytics(self) -> Dict[str, Any]:
+        """Get quotation totals and status distribution from a single GROUP BY."""
+        status_counts = (
+            self.db.query(QuotationModel.status, func.count(QuotationModel.id))
+            .group_by(QuotationModel.status)
+            .all()
+        )
+
+        distribution = {status.value: count for status, count in status_counts}
+
+        return {
+            "total_quotations": sum(distribution.values()),
+            "status_distribution": distribution,
+        }
+
     def get_quotations_by_month(self, months: int = 12) -> List[Dict[str, Any]]:
         """Get quotation statistics by month for the last N months."""
         start_date = datetime.utcnow() - timedelta(days=30 * months)
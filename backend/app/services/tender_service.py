@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import and_, asc, desc, extract, func, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Query, Session, joinedload
 
 from app.models.tender import GovernmentEntity as GovernmentEntityModel
 from app.models.tender import Tender as TenderModel
@@ -78,8 +78,8 @@ class TenderService:
         self.db.commit()
         return True
 
-    def search_tenders(self, search_params: TenderSearchParams) -> TenderSearchResponse:
-        """Search tenders with filters and pagination."""
+    def build_search_query(self, search_params: TenderSearchParams) -> Query:
+        """Build the filtered, sorted tender query (without pagination)."""
         query = self.db.query(TenderModel).options(
             joinedload(TenderModel.government_entity),
             joinedload(TenderModel.category),
@@ -93,7 +93,7 @@ class TenderService:
                     or_(
                         TenderModel.title.ilike(search_term),
                         TenderModel.description.ilike(search_term),
-                        TenderModel.notice_number.ilike(search_term),
+                        TenderModel.number.ilike(search_term),
                     )
                 )
 
@@ -129,9 +129,6 @@ class TenderService:
                     TenderModel.estimated_value <= search_params.filters.max_value
                 )
 
-        # Count total items
-        total_items = query.count()
-
         # Apply sorting
         sort_column = getattr(
             TenderModel, search_params.sort_by, TenderModel.created_at
@@ -141,6 +138,15 @@ class TenderService:
         else:
             query = query.order_by(asc(sort_column))
 
+        return query
+
+    def search_tenders(self, search_params: TenderSearchParams) -> TenderSearchResponse:
+        """Search tenders with filters and pagination."""
+        query = self.build_search_query(search_params)
+
+        # Count total items
+        total_items = query.order_by(None).count()
+
         # Apply pagination
         offset = (search_params.page - 1) * search_params.page_size
         tenders = query.offset(offset).limit(search_params.page_size).all()
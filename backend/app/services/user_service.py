@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, desc, func, or_
+from sqlalchemy import String, and_, cast, desc, func, literal, or_, update
 from sqlalchemy.orm import Session
 
 from app.core.security import (
@@ -294,25 +294,65 @@ class UserService:
 
         return {"message": "Usuário removido com sucesso"}
 
+    def bulk_update_users(
+        self, user_ids: List[UUID], values: Dict[str, Any], updated_by: UUID
+    ) -> int:
+        """Apply the same column values to several users in a single statement."""
+
+        values = dict(values)
+        if values.get("role"):
+            values["role"] = UserRole(values["role"])
+
+        stmt = (
+            update(User)
+            .where(User.id.in_(user_ids))
+            .values(**values, updated_by=updated_by, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        result = self.db.execute(stmt)
+        self.db.commit()
+        return result.rowcount
+
+    def bulk_reactivate_users(self, user_ids: List[UUID], reactivated_by: UUID) -> int:
+        """Reactivate several user accounts, resetting failed login attempts."""
+
+        return self.bulk_update_users(
+            user_ids, {"is_active": True, "failed_login_attempts": 0}, reactivated_by
+        )
+
+    def bulk_delete_users(self, user_ids: List[UUID], deleted_by: UUID) -> int:
+        """Soft delete several user accounts, as delete_user does for one."""
+
+        deleted_email = (
+            literal("deleted_") + cast(User.id, String) + literal("@deleted.com")
+        )
+        return self.bulk_update_users(
+            user_ids, {"is_active": False, "email": deleted_email}, deleted_by
+        )
+
     def get_user_stats(self) -> Dict[str, Any]:
         """Get user statistics."""
 
-        total_users = self.db.query(User).count()
-        active_users = self.db.query(User).filter(User.is_active == True).count()
-        verified_users = self.db.query(User).filter(User.is_verified == True).count()
+        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
 
-        # Users by role
+        # One grouped scan with filtered counts; totals are summed over roles
         role_stats = (
-            self.db.query(User.role, func.count(User.id).label("count"))
+            self.db.query(
+                User.role,
+                func.count(User.id).label("total"),
+                func.count(User.id).filter(User.is_active == True).label("active"),
+                func.count(User.id).filter(User.is_verified == True).label("verified"),
+                func.count(User.id)
+                .filter(User.created_at >= thirty_days_ago)
+                .label("recent"),
+            )
             .group_by(User.role)
             .all()
         )
 
-        # Recent registrations (last 30 days)
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        recent_registrations = (
-            self.db.query(User).filter(User.created_at >= thirty_days_ago).count()
-        )
+        total_users = sum(row.total for row in role_stats)
+        active_users = sum(row.active for row in role_stats)
+        verified_users = sum(row.verified for row in role_stats)
 
         return {
             "total_users": total_users,
@@ -320,8 +360,8 @@ class UserService:
             "verified_users": verified_users,
             "inactive_users": total_users - active_users,
             "unverified_users": total_users - verified_users,
-            "recent_registrations": recent_registrations,
-            "role_distribution": {role: count for role, count in role_stats},
+            "recent_registrations": sum(row.recent for row in role_stats),
+            "role_distribution": {row.role: row.total for row in role_stats},
         }
 
     # Permission management
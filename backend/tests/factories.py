@@ -8,6 +8,7 @@ from typing import Any, Dict
 import factory
 from factory import Faker, SubFactory
 from factory.alchemy import SQLAlchemyModelFactory
+from sqlalchemy import insert
 
 from app.models.user import User, UserRole, RefreshToken, AuditLog, LoginAttempt
 from app.models.tender import (
@@ -18,10 +19,10 @@ from app.models.tender import (
     GovernmentEntity,
     TenderItem,
     TenderDocument,
-    Proposal,
-    ProposalStatus,
+    TenderProposal,
 )
 from app.models.quotation import (
+    ProposalStatus,
     Quotation,
     QuotationStatus,
     QuotationPriority,
@@ -32,33 +33,36 @@ from app.models.quotation import (
 from app.models.notification import (
     Notification,
     NotificationCategory,
-    NotificationStatus,
     NotificationTemplate,
+    NotificationType,
 )
 
+# Precomputed bcrypt hash of "secret", shared by every factory-built user
+HASHED_SECRET = "$2b$12$EixZaYVK1fsbw1ZfbX3OXePaWxn96p36WQoeG6Lruj3vjPGga31lW"
+
 
 class BaseFactory(SQLAlchemyModelFactory):
     """Base factory with common configurations."""
     
     class Meta:
         abstract = True
-        sqlalchemy_session_persistence = "commit"
+        # Build in memory by default; tests add_all and commit once themselves
+        strategy = factory.BUILD_STRATEGY
+        sqlalchemy_session_persistence = None
 
 
 class UserFactory(BaseFactory):
-    """Factory for creating User instances."""
+    """Factory for creating User instances (deterministic, Faker-free fields)."""
     
     class Meta:
         model = User
     
     id = factory.LazyFunction(uuid.uuid4)
-    email = Faker("email")
-    hashed_password = factory.LazyFunction(
-        lambda: "$2b$12$EixZaYVK1fsbw1ZfbX3OXePaWxn96p36WQoeG6Lruj3vjPGga31lW"  # "secret"
-    )
-    first_name = Faker("first_name")
-    last_name = Faker("last_name")
-    company_name = Faker("company")
+    email = factory.Sequence(lambda n: f"user{n}@test.local")
+    hashed_password = HASHED_SECRET
+    first_name = factory.Sequence(lambda n: f"First{n}")
+    last_name = factory.Sequence(lambda n: f"Last{n}")
+    company_name = factory.Sequence(lambda n: f"Company {n}")
     role = factory.Iterator(UserRole)
     permissions = factory.LazyFunction(lambda: {"read": True, "write": False})
     is_active = True
@@ -74,6 +78,15 @@ class UserFactory(BaseFactory):
     updated_at = factory.LazyFunction(datetime.utcnow)
 
 
+class RealisticUserFactory(UserFactory):
+    """User factory with Faker-generated names, for tests that need realistic data."""
+    
+    email = Faker("email")
+    first_name = Faker("first_name")
+    last_name = Faker("last_name")
+    company_name = Faker("company")
+
+
 class AdminUserFactory(UserFactory):
     """Factory for creating Admin User instances."""
     
@@ -203,6 +216,19 @@ class TenderFactory(BaseFactory):
     updated_at = factory.LazyFunction(datetime.utcnow)
 
 
+class FastTenderFactory(TenderFactory):
+    """Tender factory for bulk seeding: builds only, no Faker text."""
+    
+    class Meta:
+        strategy = factory.BUILD_STRATEGY
+    
+    title = factory.Sequence(lambda n: f"Tender {n}")
+    description = factory.Sequence(lambda n: f"Tender description {n}")
+    estimated_value = factory.Sequence(lambda n: 100000 + n)
+    external_url = factory.Sequence(lambda n: f"https://example.gov.br/tender/{n}")
+    ai_score = 5.0
+
+
 class TenderItemFactory(BaseFactory):
     """Factory for creating TenderItem instances."""
     
@@ -246,10 +272,10 @@ class TenderDocumentFactory(BaseFactory):
 
 
 class ProposalFactory(BaseFactory):
-    """Factory for creating Proposal instances."""
+    """Factory for creating TenderProposal instances."""
     
     class Meta:
-        model = Proposal
+        model = TenderProposal
     
     id = factory.LazyFunction(uuid.uuid4)
     tender = SubFactory(TenderFactory)
@@ -372,7 +398,7 @@ class NotificationFactory(BaseFactory):
     category = factory.Iterator(NotificationCategory)
     title = Faker("sentence", nb_words=4)
     message = Faker("text", max_nb_chars=300)
-    status = factory.Iterator(NotificationStatus)
+    type = factory.Iterator(NotificationType)
     priority = factory.Iterator(["LOW", "MEDIUM", "HIGH", "URGENT"])
     data = factory.LazyFunction(lambda: {"tender_id": str(uuid.uuid4())})
     expires_at = factory.LazyFunction(lambda: datetime.utcnow() + timedelta(days=30))
@@ -422,15 +448,60 @@ def create_bulk_quotations(count: int, **kwargs) -> list[Quotation]:
     return [QuotationFactory(**kwargs) for _ in range(count)]
 
 
+async def bulk_insert(session, model, rows: list[dict]) -> None:
+    """Insert ``model`` rows in one round trip.
+
+    PostgreSQL loads them with COPY; other dialects get one executemany INSERT.
+    """
+    connection = await session.connection()
+    dialect = connection.dialect
+    if dialect.name != "postgresql":
+        await session.execute(insert(model), rows)
+        return
+
+    # COPY bypasses SQLAlchemy, so Python-side column defaults are applied here
+    keys = {key for row in rows for key in row}
+    columns = [
+        column
+        for column in model.__table__.columns
+        if column.key in keys
+        or (column.default is not None and not column.default.is_clause_element)
+    ]
+    processors = [column.type.bind_processor(dialect) for column in columns]
+    records = []
+    for row in rows:
+        values = [
+            row[column.key] if column.key in row
+            else None if column.default is None or column.default.is_clause_element
+            else column.default.arg(None) if column.default.is_callable
+            else column.default.arg
+            for column in columns
+        ]
+        records.append(tuple(
+            processor(value) if processor else value
+            for value, processor in zip(values, processors)
+        ))
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        model.__tablename__,
+        records=records,
+        columns=[column.name for column in columns],
+    )
+
+
+async def seed_users(session, rows: list[dict]) -> None:
+    """Insert user rows with the shared test password (see ``bulk_insert``)."""
+    await bulk_insert(
+        session, User, [{"hashed_password": HASHED_SECRET, **row} for row in rows]
+    )
+
+
 # Factory traits for common scenarios
 class TenderWithItemsFactory(TenderFactory):
     """Factory for creating Tender with items."""
     
     @factory.post_generation
     def items(obj, create, extracted, **kwargs):
-        if not create:
-            return
-        
         if extracted:
             for item_data in extracted:
                 TenderItemFactory(tender=obj, **item_data)
@@ -445,9 +516,6 @@ class TenderWithDocumentsFactory(TenderFactory):
     
     @factory.post_generation
     def documents(obj, create, extracted, **kwargs):
-        if not create:
-            return
-        
         if extracted:
             for doc_data in extracted:
                 TenderDocumentFactory(tender=obj, **doc_data)
@@ -462,9 +530,6 @@ class QuotationWithItemsFactory(QuotationFactory):
     
     @factory.post_generation
     def items(obj, create, extracted, **kwargs):
-        if not create:
-            return
-        
         if extracted:
             for item_data in extracted:
                 QuotationItemFactory(quotation=obj, **item_data)
@@ -479,15 +544,11 @@ class CompleteTenderFactory(TenderFactory):
     
     @factory.post_generation
     def items(obj, create, extracted, **kwargs):
-        if not create:
-            return
         for i in range(3):
             TenderItemFactory(tender=obj)
     
     @factory.post_generation
     def documents(obj, create, extracted, **kwargs):
-        if not create:
-            return
         for i in range(2):
             TenderDocumentFactory(tender=obj)
 
@@ -497,14 +558,10 @@ class CompleteQuotationFactory(QuotationFactory):
     
     @factory.post_generation
     def items(obj, create, extracted, **kwargs):
-        if not create:
-            return
         for i in range(2):
             QuotationItemFactory(quotation=obj)
     
     @factory.post_generation
     def documents(obj, create, extracted, **kwargs):
-        if not create:
-            return
         for i in range(1):
             QuotationDocumentFactory(quotation=obj)
\ No newline at end of file
@@ -3,25 +3,106 @@ User API endpoint tests for COTAI backend.
 Tests for user management, profile operations, admin functions, and bulk operations.
 """
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from typing import Any, AsyncGenerator
 
+import orjson
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.security import create_access_token
 from app.models.user import User, UserRole
 from tests.factories import (
+    HASHED_SECRET,
     UserFactory,
     AdminUserFactory,
     SuperUserFactory,
-    UserWithMFAFactory,
-    create_test_user,
-    create_admin_user,
-    create_bulk_users,
+    seed_users,
 )
 
+# Keep the user tests on one xdist worker under --dist loadgroup
+pytestmark = pytest.mark.xdist_group("users_api")
+
+# Minimal valid user payload; tests override single fields from it
+_BASE_USER_PAYLOAD = {
+    "password": "SecurePassword123!",
+    "first_name": "Test",
+    "last_name": "User",
+    "company_name": "Test Company",
+}
+
+# Valid UUID that is never assigned to a seeded row
+_MISSING_ID = "00000000-0000-4000-8000-000000000000"
+
+# Rows in the shared performance corpus
+_PERF_CORPUS_SIZE = 100
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+
+def _send_json(client: AsyncClient, method: str, url: str, payload: Any, headers: dict):
+    """Send ``payload`` encoded with orjson instead of httpx's stdlib ``json=``.
+
+    orjson serializes ``uuid.UUID`` natively, so ids need no ``str()`` first.
+    """
+    return client.request(
+        method,
+        url,
+        content=orjson.dumps(payload),
+        headers={**headers, **_JSON_CONTENT_TYPE},
+    )
+
+
+def _json(response) -> Any:
+    """Decode a response body with orjson."""
+    return orjson.loads(response.content)
+
+
+async def _seed(session: AsyncSession, objs: list) -> None:
+    """Add built instances in one unit-of-work pass and commit them."""
+    session.add_all(objs)
+    await session.commit()
+
+
+@asynccontextmanager
+async def _class_dataset(engine, rows: list[dict]):
+    """Seed user rows once on a dedicated connection inside an outer transaction.
+
+    Per-test sessions nest a savepoint on the same connection (see
+    ``_savepoint_session``), so the rows survive each test's rollback and
+    vanish when the outer transaction is rolled back.
+    """
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+        await seed_users(session, rows)
+        await session.commit()
+        await session.close()
+        try:
+            yield conn
+        finally:
+            await transaction.rollback()
+
+
+@asynccontextmanager
+async def _savepoint_session(conn) -> AsyncGenerator[AsyncSession, None]:
+    """Session on a dataset connection whose changes roll back to a savepoint."""
+    savepoint = await conn.begin_nested()
+    session = AsyncSession(
+        bind=conn,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    try:
+        yield session
+    finally:
+        await session.close()
+        await savepoint.rollback()
+
 
 @pytest.mark.api
 @pytest.mark.asyncio
@@ -33,11 +114,9 @@ class TestUsersCRUD:
     ):
         """Test successful user creation by admin."""
         user_data = {
+            **_BASE_USER_PAYLOAD,
             "email": "newuser@example.com",
-            "password": "SecurePassword123!",
             "first_name": "New",
-            "last_name": "User",
-            "company_name": "Test Company",
             "role": "USER",
             "permissions": {
                 "tenders": {"read": True, "write": False},
@@ -45,14 +124,16 @@ class TestUsersCRUD:
             }
         }
         
-        response = await async_client.post(
+        response = await _send_json(
+            async_client,
+            "POST",
             "/api/v1/users",
-            json=user_data,
-            headers=admin_headers
+            user_data,
+            admin_headers,
         )
         
         assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
+        data = _json(response)
         assert data["email"] == user_data["email"]
         assert data["first_name"] == user_data["first_name"]
         assert data["last_name"] == user_data["last_name"]
@@ -76,14 +157,16 @@ class TestUsersCRUD:
             "role": "INVALID_ROLE",  # Invalid role
         }
         
-        response = await async_client.post(
+        response = await _send_json(
+            async_client,
+            "POST",
             "/api/v1/users",
-            json=invalid_user_data,
-            headers=admin_headers
+            invalid_user_data,
+            admin_headers,
         )
         
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-        error_data = response.json()
+        error_data = _json(response)
         assert "detail" in error_data
         assert len(error_data["detail"]) > 0
 
@@ -91,43 +174,53 @@ class TestUsersCRUD:
         self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
     ):
         """Test user creation with duplicate email."""
-        existing_user = UserFactory()
-        async_db_session.add(existing_user)
+        existing_email = (
+            await async_db_session.execute(
+                insert(User)
+                .values(
+                    email="duplicate@test.local",
+                    hashed_password=HASHED_SECRET,
+                    first_name="Existing",
+                    last_name="User",
+                )
+                .returning(User.email)
+            )
+        ).scalar_one()
         await async_db_session.commit()
         
         user_data = {
-            "email": existing_user.email,
-            "password": "SecurePassword123!",
+            **_BASE_USER_PAYLOAD,
+            "email": existing_email,
             "first_name": "New",
-            "last_name": "User",
-            "company_name": "Test Company",
         }
         
-        response = await async_client.post(
+        response = await _send_json(
+            async_client,
+            "POST",
             "/api/v1/users",
-            json=user_data,
-            headers=admin_headers
+            user_data,
+            admin_headers,
         )
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "already exists" in response.json()["detail"].lower()
+        assert "already exists" in _json(response)["detail"].lower()
 
     async def test_create_user_non_admin_forbidden(
         self, async_client: AsyncClient, async_db_session: AsyncSession, authenticated_headers: dict
     ):
         """Test user creation by non-admin is forbidden."""
         user_data = {
+            **_BASE_USER_PAYLOAD,
             "email": "newuser@example.com",
-            "password": "SecurePassword123!",
             "first_name": "New",
-            "last_name": "User",
-            "company_name": "Test Company",
         }
         
-        response = await async_client.post(
+        response = await _send_json(
+            async_client,
+            "POST",
             "/api/v1/users",
-            json=user_data,
-            headers=authenticated_headers
+            user_data,
+            authenticated_headers,
         )
         
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -136,7 +229,7 @@ class TestUsersCRUD:
         self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
     ):
         """Test successful user retrieval by admin."""
-        user = UserFactory()
+        user = UserFactory.build()
         async_db_session.add(user)
         await async_db_session.commit()
         
@@ -146,7 +239,7 @@ class TestUsersCRUD:
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert data["id"] == str(user.id)
         assert data["email"] == user.email
         assert data["first_name"] == user.first_name
@@ -159,10 +252,8 @@ class TestUsersCRUD:
         self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
     ):
         """Test retrieval of non-existent user."""
-        non_existent_id = str(uuid.uuid4())
-        
         response = await async_client.get(
-            f"/api/v1/users/{non_existent_id}",
+            f"/api/v1/users/{_MISSING_ID}",
             headers=admin_headers
         )
         
@@ -172,7 +263,7 @@ class TestUsersCRUD:
         self, async_client: AsyncClient, async_db_session: AsyncSession, authenticated_headers: dict
     ):
         """Test user retrieval by non-admin is forbidden."""
-        user = UserFactory()
+        user = UserFactory.build()
         async_db_session.add(user)
         await async_db_session.commit()
         
@@ -187,7 +278,7 @@ class TestUsersCRUD:
         self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
     ):
         """Test successful user update by admin."""
-        user = UserFactory()
+        user = UserFactory.build()
         async_db_session.add(user)
         await async_db_session.commit()
         
@@ -202,14 +293,16 @@ class TestUsersCRUD:
             }
         }
         
-        response = await async_client.put(
+        response = await _send_json(
+            async_client,
+            "PUT",
             f"/api/v1/users/{user.id}",
-            json=update_data,
-            headers=admin_headers
+            update_data,
+            admin_headers,
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert data["first_name"] == update_data["first_name"]
         assert data["last_name"] == update_data["last_name"]
         assert data["company_name"] == update_data["company_name"]
@@ -220,13 +313,14 @@ class TestUsersCRUD:
         self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
     ):
         """Test updating non-existent user."""
-        non_existent_id = str(uuid.uuid4())
         update_data = {"first_name": "Updated"}
         
-        response = await async_client.put(
-            f"/api/v1/users/{non_existent_id}",
-            json=update_data,
-            headers=admin_headers
+        response = await _send_json(
+            async_client,
+            "PUT",
+            f"/api/v1/users/{_MISSING_ID}",
+            update_data,
+            admin_headers,
         )
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -235,7 +329,7 @@ class TestUsersCRUD:
         self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
     ):
         """Test successful user deletion by admin."""
-        user = UserFactory()
+        user = UserFactory.build()
         async_db_session.add(user)
         await async_db_session.commit()
         
@@ -250,10 +344,8 @@ class TestUsersCRUD:
         self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
     ):
         """Test deleting non-existent user."""
-        non_existent_id = str(uuid.uuid4())
-        
         response = await async_client.delete(
-            f"/api/v1/users/{non_existent_id}",
+            f"/api/v1/users/{_MISSING_ID}",
             headers=admin_headers
         )
         
@@ -263,10 +355,8 @@ class TestUsersCRUD:
         self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
     ):
         """Test successful user listing by admin."""
-        users = [UserFactory() for _ in range(5)]
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
+        users = [UserFactory.build() for _ in range(5)]
+        await _seed(async_db_session, users)
         
         response = await async_client.get(
             "/api/v1/users",
@@ -274,7 +364,7 @@ class TestUsersCRUD:
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert "items" in data
         assert "total" in data
         assert "page" in data
@@ -286,10 +376,8 @@ class TestUsersCRUD:
         self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
     ):
         """Test user listing with pagination."""
-        users = [UserFactory() for _ in range(10)]
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
+        users = [UserFactory.build() for _ in range(10)]
+        await _seed(async_db_session, users)
         
         response = await async_client.get(
             "/api/v1/users?page=1&size=5",
@@ -297,7 +385,7 @@ class TestUsersCRUD:
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert len(data["items"]) == 5
         assert data["page"] == 1
         assert data["size"] == 5
@@ -330,7 +418,7 @@ class TestUsersProfile:
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert "id" in data
         assert "email" in data
         assert "first_name" in data
@@ -358,14 +446,16 @@ class TestUsersProfile:
             "company_name": "Updated Company"
         }
         
-        response = await async_client.put(
+        response = await _send_json(
+            async_client,
+            "PUT",
             "/api/v1/users/me",
-            json=update_data,
-            headers=authenticated_headers
+            update_data,
+            authenticated_headers,
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert data["first_name"] == update_data["first_name"]
         assert data["last_name"] == update_data["last_name"]
         assert data["company_name"] == update_data["company_name"]
@@ -381,14 +471,16 @@ class TestUsersProfile:
             "is_superuser": True  # Should not be allowed
         }
         
-        response = await async_client.put(
+        response = await _send_json(
+            async_client,
+            "PUT",
             "/api/v1/users/me",
-            json=update_data,
-            headers=authenticated_headers
+            update_data,
+            authenticated_headers,
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert data["first_name"] == update_data["first_name"]
         # Role should remain unchanged
         assert data["role"] != "ADMIN"
@@ -404,14 +496,16 @@ class TestUsersProfile:
             "confirm_password": "NewSecurePassword123!"
         }
         
-        response = await async_client.put(
+        response = await _send_json(
+            async_client,
+            "PUT",
             "/api/v1/users/me/password",
-            json=password_data,
-            headers=authenticated_headers
+            password_data,
+            authenticated_headers,
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert "password changed" in data["message"].lower()
 
     async def test_change_password_invalid_current(
@@ -424,14 +518,16 @@ class TestUsersProfile:
             "confirm_password": "NewSecurePassword123!"
         }
         
-        response = await async_client.put(
+        response = await _send_json(
+            async_client,
+            "PUT",
             "/api/v1/users/me/password",
-            json=password_data,
-            headers=authenticated_headers
+            password_data,
+            authenticated_headers,
         )
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "current password" in response.json()["detail"].lower()
+        assert "current password" in _json(response)["detail"].lower()
 
     async def test_change_password_mismatch(
         self, async_client: AsyncClient, async_db_session: AsyncSession, authenticated_headers: dict
@@ -443,14 +539,16 @@ class TestUsersProfile:
             "confirm_password": "DifferentPassword123!"
         }
         
-        response = await async_client.put(
+        response = await _send_json(
+            async_client,
+            "PUT",
             "/api/v1/users/me/password",
-            json=password_data,
-            headers=authenticated_headers
+            password_data,
+            authenticated_headers,
         )
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "passwords do not match" in response.json()["detail"].lower()
+        assert "passwords do not match" in _json(response)["detail"].lower()
 
     async def test_change_password_weak_password(
         self, async_client: AsyncClient, async_db_session: AsyncSession, authenticated_headers: dict
@@ -462,14 +560,16 @@ class TestUsersProfile:
             "confirm_password": "weak"
         }
         
-        response = await async_client.put(
+        response = await _send_json(
+            async_client,
+            "PUT",
             "/api/v1/users/me/password",
-            json=password_data,
-            headers=authenticated_headers
+            password_data,
+            authenticated_headers,
         )
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "password" in response.json()["detail"].lower()
+        assert "password" in _json(response)["detail"].lower()
 
     async def test_deactivate_own_account(
         self, async_client: AsyncClient, async_db_session: AsyncSession, authenticated_headers: dict
@@ -481,7 +581,7 @@ class TestUsersProfile:
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert "deactivated" in data["message"].lower()
 
     async def test_delete_own_account_request(
@@ -494,7 +594,7 @@ class TestUsersProfile:
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert "deletion request" in data["message"].lower()
 
 
@@ -503,39 +603,39 @@ class TestUsersProfile:
 class TestUsersValidation:
     """Test user validation rules."""
 
-    async def test_user_email_validation(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
-    ):
-        """Test user email validation."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "email, expected_status",
+        [
             ("", status.HTTP_422_UNPROCESSABLE_ENTITY),  # Empty email
             ("invalid-email", status.HTTP_422_UNPROCESSABLE_ENTITY),  # Invalid format
             ("valid@example.com", status.HTTP_201_CREATED),  # Valid email
             ("user.name+tag@example.com", status.HTTP_201_CREATED),  # Valid complex email
-        ]
+        ],
+        ids=["empty", "invalid_format", "valid", "valid_complex"],
+    )
+    async def test_user_email_validation(
+        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict,
+        email: str, expected_status: int
+    ):
+        """Test user email validation."""
+        user_data = {
+            **_BASE_USER_PAYLOAD,
+            "email": email,
+        }
         
-        for email, expected_status in test_cases:
-            user_data = {
-                "email": email,
-                "password": "SecurePassword123!",
-                "first_name": "Test",
-                "last_name": "User",
-                "company_name": "Test Company",
-            }
-            
-            response = await async_client.post(
-                "/api/v1/users",
-                json=user_data,
-                headers=admin_headers
-            )
-            
-            assert response.status_code == expected_status
+        response = await _send_json(
+            async_client,
+            "POST",
+            "/api/v1/users",
+            user_data,
+            admin_headers,
+        )
+        
+        assert response.status_code == expected_status
 
-    async def test_user_password_validation(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
-    ):
-        """Test user password validation."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "password, expected_status",
+        [
             ("", status.HTTP_422_UNPROCESSABLE_ENTITY),  # Empty password
             ("weak", status.HTTP_422_UNPROCESSABLE_ENTITY),  # Too weak
             ("password123", status.HTTP_422_UNPROCESSABLE_ENTITY),  # No uppercase
@@ -543,97 +643,100 @@ class TestUsersValidation:
             ("PasswordABC", status.HTTP_422_UNPROCESSABLE_ENTITY),  # No numbers
             ("Password123", status.HTTP_422_UNPROCESSABLE_ENTITY),  # No special chars
             ("Password123!", status.HTTP_201_CREATED),  # Valid password
-        ]
+        ],
+        ids=[
+            "empty", "too_weak", "no_uppercase", "no_lowercase",
+            "no_numbers", "no_special_chars", "valid",
+        ],
+    )
+    async def test_user_password_validation(
+        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict,
+        password: str, expected_status: int
+    ):
+        """Test user password validation."""
+        user_data = {
+            **_BASE_USER_PAYLOAD,
+            "email": "test_password@example.com",
+            "password": password,
+        }
         
-        for password, expected_status in test_cases:
-            user_data = {
-                "email": f"test_{len(password)}@example.com",
-                "password": password,
-                "first_name": "Test",
-                "last_name": "User",
-                "company_name": "Test Company",
-            }
-            
-            response = await async_client.post(
-                "/api/v1/users",
-                json=user_data,
-                headers=admin_headers
-            )
-            
-            assert response.status_code == expected_status
+        response = await _send_json(
+            async_client,
+            "POST",
+            "/api/v1/users",
+            user_data,
+            admin_headers,
+        )
+        
+        assert response.status_code == expected_status
 
-    async def test_user_name_validation(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
-    ):
-        """Test user name validation."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "first_name, last_name, expected_status",
+        [
             ("", "Last", status.HTTP_422_UNPROCESSABLE_ENTITY),  # Empty first name
             ("First", "", status.HTTP_422_UNPROCESSABLE_ENTITY),  # Empty last name
             ("A" * 101, "Last", status.HTTP_422_UNPROCESSABLE_ENTITY),  # Too long first name
             ("First", "A" * 101, status.HTTP_422_UNPROCESSABLE_ENTITY),  # Too long last name
             ("Valid", "Name", status.HTTP_201_CREATED),  # Valid names
-        ]
+        ],
+        ids=["empty_first", "empty_last", "long_first", "long_last", "valid"],
+    )
+    async def test_user_name_validation(
+        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict,
+        first_name: str, last_name: str, expected_status: int
+    ):
+        """Test user name validation."""
+        user_data = {
+            **_BASE_USER_PAYLOAD,
+            "email": "test_name@example.com",
+            "first_name": first_name,
+            "last_name": last_name,
+        }
         
-        for first_name, last_name, expected_status in test_cases:
-            user_data = {
-                "email": f"test_{len(first_name)}_{len(last_name)}@example.com",
-                "password": "SecurePassword123!",
-                "first_name": first_name,
-                "last_name": last_name,
-                "company_name": "Test Company",
-            }
-            
-            response = await async_client.post(
-                "/api/v1/users",
-                json=user_data,
-                headers=admin_headers
-            )
-            
-            assert response.status_code == expected_status
-
+        response = await _send_json(
+            async_client,
+            "POST",
+            "/api/v1/users",
+            user_data,
+            admin_headers,
+        )
+        
+        assert response.status_code == expected_status
+
+    @pytest.mark.parametrize(
+        "role, expected_status",
+        [
+            ("GUEST", status.HTTP_201_CREATED),
+            ("USER", status.HTTP_201_CREATED),
+            ("MANAGER", status.HTTP_201_CREATED),
+            ("ADMIN", status.HTTP_201_CREATED),
+            ("SUPER_ADMIN", status.HTTP_201_CREATED),
+            ("INVALID_ROLE", status.HTTP_422_UNPROCESSABLE_ENTITY),
+        ],
+        ids=lambda value: value.lower() if isinstance(value, str) else None,
+    )
     async def test_user_role_validation(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
+        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict,
+        role: str, expected_status: int
     ):
         """Test user role validation."""
-        valid_roles = ["GUEST", "USER", "MANAGER", "ADMIN", "SUPER_ADMIN"]
-        
-        for role in valid_roles:
-            user_data = {
-                "email": f"test_{role.lower()}@example.com",
-                "password": "SecurePassword123!",
-                "first_name": "Test",
-                "last_name": "User",
-                "company_name": "Test Company",
-                "role": role
-            }
-            
-            response = await async_client.post(
-                "/api/v1/users",
-                json=user_data,
-                headers=admin_headers
-            )
-            
-            assert response.status_code == status.HTTP_201_CREATED
-            data = response.json()
-            assert data["role"] == role
-
-        # Test invalid role
-        invalid_user_data = {
-            "email": "test_invalid@example.com",
-            "password": "SecurePassword123!",
-            "first_name": "Test",
-            "last_name": "User",
-            "company_name": "Test Company",
-            "role": "INVALID_ROLE"
+        user_data = {
+            **_BASE_USER_PAYLOAD,
+            "email": "test_role@example.com",
+            "role": role,
         }
         
-        response = await async_client.post(
+        response = await _send_json(
+            async_client,
+            "POST",
             "/api/v1/users",
-            json=invalid_user_data,
-            headers=admin_headers
+            user_data,
+            admin_headers,
         )
         
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.status_code == expected_status
+        if expected_status == status.HTTP_201_CREATED:
+            assert _json(response)["role"] == role
 
     async def test_user_permissions_validation(
         self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
@@ -646,22 +749,21 @@ class TestUsersValidation:
         }
         
         user_data = {
+            **_BASE_USER_PAYLOAD,
             "email": "test_permissions@example.com",
-            "password": "SecurePassword123!",
-            "first_name": "Test",
-            "last_name": "User",
-            "company_name": "Test Company",
-            "permissions": valid_permissions
+            "permissions": valid_permissions,
         }
         
-        response = await async_client.post(
+        response = await _send_json(
+            async_client,
+            "POST",
             "/api/v1/users",
-            json=user_data,
-            headers=admin_headers
+            user_data,
+            admin_headers,
         )
         
         assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
+        data = _json(response)
         assert data["permissions"] == valid_permissions
 
 
@@ -670,197 +772,158 @@ class TestUsersValidation:
 class TestUsersFiltering:
     """Test user filtering and search functionality."""
 
+    @pytest.fixture(scope="class")
+    async def filtering_dataset(self, async_db_engine):
+        """Seed one read-only user set for the class (see ``_class_dataset``)."""
+        users = {
+            "john": {
+                "email": "john.doe@example.com", "first_name": "John",
+                "last_name": "Doe", "company": "Design Studio",
+                "role": UserRole.MANAGER, "is_active": True,
+            },
+            "alice": {
+                "email": "alice.smith@example.com", "first_name": "Alice",
+                "last_name": "Smith", "company": "Tech Corp",
+                "role": UserRole.VIEWER, "is_active": True,
+            },
+            "charlie": {
+                "email": "charlie.brown@company.com", "first_name": "Charlie",
+                "last_name": "Brown", "company": "Tech Solutions",
+                "role": UserRole.ADMIN, "is_active": True,
+            },
+            "target": {
+                "email": "target@example.com", "first_name": "Target",
+                "last_name": "User", "company": "Target Company",
+                "role": UserRole.VIEWER, "is_active": True,
+            },
+            "other": {
+                "email": "other@example.com", "first_name": "Other",
+                "last_name": "User", "company": "Target Company",
+                "role": UserRole.MANAGER, "is_active": True,
+            },
+            "inactive": {
+                "email": "bob.wilson@company.com", "first_name": "Bob",
+                "last_name": "Wilson", "company": "Wilson Ltd",
+                "role": UserRole.VIEWER, "is_active": False,
+            },
+        }
+        async with _class_dataset(
+            async_db_engine, list(users.values())
+        ) as conn:
+            yield {"connection": conn, "users": users}
+
+    @pytest.fixture
+    async def async_db_session(self, filtering_dataset):
+        """Test session on the dataset's connection, rolled back to the seeded state."""
+        async with _savepoint_session(filtering_dataset["connection"]) as session:
+            yield session
+
     async def test_filter_users_by_role(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
+        self, async_client: AsyncClient, filtering_dataset: dict, admin_headers: dict
     ):
         """Test filtering users by role."""
-        # Create users with different roles
-        user1 = UserFactory(role=UserRole.USER)
-        user2 = UserFactory(role=UserRole.MANAGER)
-        user3 = AdminUserFactory()
-        
-        async_db_session.add(user1)
-        async_db_session.add(user2)
-        async_db_session.add(user3)
-        await async_db_session.commit()
-        
-        # Filter by USER role
         response = await async_client.get(
-            "/api/v1/users?role=USER",
+            "/api/v1/users?role=viewer",
             headers=admin_headers
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert len(data["items"]) == 1
-        assert data["items"][0]["role"] == "USER"
+        data = _json(response)
+        expected = {
+            user["email"] for user in filtering_dataset["users"].values()
+            if user["role"] == UserRole.VIEWER
+        }
+        assert {item["email"] for item in data["items"]} == expected
+        assert all(item["role"] == "viewer" for item in data["items"])
 
     async def test_filter_users_by_active_status(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
+        self, async_client: AsyncClient, filtering_dataset: dict, admin_headers: dict
     ):
         """Test filtering users by active status."""
-        # Create users with different active statuses
-        active_user = UserFactory(is_active=True)
-        inactive_user = UserFactory(is_active=False)
-        
-        async_db_session.add(active_user)
-        async_db_session.add(inactive_user)
-        await async_db_session.commit()
-        
-        # Filter by active status
         response = await async_client.get(
             "/api/v1/users?is_active=true",
             headers=admin_headers
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert len(data["items"]) == 1
-        assert data["items"][0]["is_active"] == True
+        data = _json(response)
+        assert all(item["is_active"] == True for item in data["items"])
+        emails = {item["email"] for item in data["items"]}
+        assert filtering_dataset["users"]["inactive"]["email"] not in emails
+        assert filtering_dataset["users"]["alice"]["email"] in emails
 
     async def test_search_users_by_email(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
+        self, async_client: AsyncClient, filtering_dataset: dict, admin_headers: dict
     ):
         """Test searching users by email."""
-        # Create users with different emails
-        user1 = UserFactory(email="john.doe@example.com")
-        user2 = UserFactory(email="jane.smith@example.com")
-        user3 = UserFactory(email="bob.wilson@company.com")
-        
-        async_db_session.add(user1)
-        async_db_session.add(user2)
-        async_db_session.add(user3)
-        await async_db_session.commit()
-        
-        # Search for "john"
         response = await async_client.get(
             "/api/v1/users?search=john",
             headers=admin_headers
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert len(data["items"]) == 1
         assert "john" in data["items"][0]["email"].lower()
 
     async def test_search_users_by_name(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
+        self, async_client: AsyncClient, filtering_dataset: dict, admin_headers: dict
     ):
         """Test searching users by name."""
-        # Create users with different names
-        user1 = UserFactory(first_name="Alice", last_name="Johnson")
-        user2 = UserFactory(first_name="Bob", last_name="Smith")
-        user3 = UserFactory(first_name="Charlie", last_name="Brown")
-        
-        async_db_session.add(user1)
-        async_db_session.add(user2)
-        async_db_session.add(user3)
-        await async_db_session.commit()
-        
-        # Search for "Alice"
         response = await async_client.get(
             "/api/v1/users?search=Alice",
             headers=admin_headers
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert len(data["items"]) == 1
         assert data["items"][0]["first_name"] == "Alice"
 
     async def test_search_users_by_company(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
+        self, async_client: AsyncClient, filtering_dataset: dict, admin_headers: dict
     ):
         """Test searching users by company name."""
-        # Create users with different companies
-        user1 = UserFactory(company_name="Tech Corp")
-        user2 = UserFactory(company_name="Design Studio")
-        user3 = UserFactory(company_name="Tech Solutions")
-        
-        async_db_session.add(user1)
-        async_db_session.add(user2)
-        async_db_session.add(user3)
-        await async_db_session.commit()
-        
-        # Search for "Tech"
         response = await async_client.get(
             "/api/v1/users?search=Tech",
             headers=admin_headers
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert len(data["items"]) == 2
 
     async def test_combined_filters(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
+        self, async_client: AsyncClient, filtering_dataset: dict, admin_headers: dict
     ):
         """Test combining multiple filters."""
-        # Create users with specific combinations
-        target_user = UserFactory(
-            role=UserRole.USER,
-            is_active=True,
-            first_name="Target",
-            company_name="Target Company"
-        )
-        other_user = UserFactory(
-            role=UserRole.MANAGER,
-            is_active=True,
-            first_name="Other",
-            company_name="Target Company"
-        )
-        
-        async_db_session.add(target_user)
-        async_db_session.add(other_user)
-        await async_db_session.commit()
-        
-        # Apply multiple filters
         response = await async_client.get(
-            "/api/v1/users?role=USER&is_active=true&search=Target",
+            "/api/v1/users?role=viewer&is_active=true&search=Target",
             headers=admin_headers
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert len(data["items"]) == 1
         assert data["items"][0]["first_name"] == "Target"
 
     async def test_sort_users(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
+        self, async_client: AsyncClient, filtering_dataset: dict, admin_headers: dict
     ):
         """Test sorting users."""
-        # Create users with different creation dates
-        user1 = UserFactory(
-            first_name="Alice",
-            created_at=datetime(2025, 1, 1)
-        )
-        user2 = UserFactory(
-            first_name="Bob",
-            created_at=datetime(2025, 1, 2)
-        )
-        user3 = UserFactory(
-            first_name="Charlie",
-            created_at=datetime(2025, 1, 3)
-        )
-        
-        async_db_session.add(user1)
-        async_db_session.add(user2)
-        async_db_session.add(user3)
-        await async_db_session.commit()
-        
-        # Sort by first name ascending
         response = await async_client.get(
             "/api/v1/users?sort_by=first_name&sort_order=asc",
             headers=admin_headers
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert len(data["items"]) == 3
+        data = _json(response)
+        # The seeded users plus the admin making the request
+        assert len(data["items"]) == len(filtering_dataset["users"]) + 1
         
         # Check sorting order
         names = [item["first_name"] for item in data["items"]]
-        assert names == sorted(names)
+        assert all(a <= b for a, b in zip(names, names[1:])), names
 
 
 @pytest.mark.api
@@ -868,171 +931,72 @@ class TestUsersFiltering:
 class TestUsersBulkOperations:
     """Test bulk operations on users."""
 
-    async def test_bulk_create_users(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
+    @pytest.mark.parametrize(
+        "path,payload,seed_kwargs",
+        [
+            pytest.param(
+                "/api/v1/users/bulk",
+                {"updates": {"is_active": False, "is_verified": False}},
+                {},
+                id="update",
+            ),
+            pytest.param(
+                "/api/v1/users/bulk/role",
+                {"role": "manager"},
+                {"role": UserRole.VIEWER},
+                id="role",
+            ),
+            pytest.param(
+                "/api/v1/users/bulk/deactivate", {}, {"is_active": True}, id="deactivate"
+            ),
+            pytest.param(
+                "/api/v1/users/bulk/activate", {}, {"is_active": False}, id="activate"
+            ),
+        ],
+    )
+    async def test_bulk_mutation(
+        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict,
+        path: str, payload: dict, seed_kwargs: dict
     ):
-        """Test bulk user creation."""
-        users_data = [
-            {
-                "email": f"user{i}@example.com",
-                "password": "SecurePassword123!",
-                "first_name": f"User{i}",
-                "last_name": "Test",
-                "company_name": "Test Company",
-                "role": "USER"
-            }
-            for i in range(1, 4)
-        ]
-        
-        response = await async_client.post(
-            "/api/v1/users/bulk",
-            json={"users": users_data},
-            headers=admin_headers
-        )
-        
-        assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
-        assert data["created_count"] == 3
-        assert len(data["users"]) == 3
-
-    async def test_bulk_update_users(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
-    ):
-        """Test bulk user update."""
-        users = [UserFactory() for _ in range(3)]
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
-        
-        user_ids = [str(user.id) for user in users]
-        
-        bulk_update_data = {
-            "user_ids": user_ids,
-            "updates": {
-                "is_active": False,
-                "company_name": "Updated Company"
-            }
-        }
-        
-        response = await async_client.put(
-            "/api/v1/users/bulk",
-            json=bulk_update_data,
-            headers=admin_headers
+        """Test the bulk PUT endpoints update every selected user."""
+        users = [UserFactory.build(**seed_kwargs) for _ in range(3)]
+        await _seed(async_db_session, users)
+        
+        response = await _send_json(
+            async_client,
+            "PUT",
+            path,
+            {"user_ids": [user.id for user in users], **payload},
+            admin_headers,
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["updated_count"] == 3
+        data = _json(response)
+        assert data["updated_count"] == len(users)
 
     async def test_bulk_delete_users(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
+        self, async_client: AsyncClient, async_db_session: AsyncSession
     ):
-        """Test bulk user deletion."""
-        users = [UserFactory() for _ in range(3)]
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
-        
-        user_ids = [str(user.id) for user in users]
+        """Test bulk user deletion (superuser only)."""
+        superuser = SuperUserFactory.build()
+        users = [UserFactory.build() for _ in range(3)]
+        await _seed(async_db_session, [superuser, *users])
+        token = create_access_token(
+            subject=str(superuser.id), additional_claims={"email": superuser.email}
+        )
         
-        response = await async_client.delete(
+        response = await _send_json(
+            async_client,
+            "DELETE",
             "/api/v1/users/bulk",
-            json={"user_ids": user_ids},
-            headers=admin_headers
+            {"user_ids": [user.id for user in users]},
+            {"Authorization": f"Bearer {token}"},
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert data["deleted_count"] == 3
 
-    async def test_bulk_role_assignment(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
-    ):
-        """Test bulk role assignment."""
-        users = [UserFactory(role=UserRole.USER) for _ in range(3)]
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
-        
-        user_ids = [str(user.id) for user in users]
-        
-        bulk_role_data = {
-            "user_ids": user_ids,
-            "role": "MANAGER"
-        }
-        
-        response = await async_client.put(
-            "/api/v1/users/bulk/role",
-            json=bulk_role_data,
-            headers=admin_headers
-        )
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["updated_count"] == 3
-
-    async def test_bulk_permissions_update(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
-    ):
-        """Test bulk permissions update."""
-        users = [UserFactory() for _ in range(3)]
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
-        
-        user_ids = [str(user.id) for user in users]
-        
-        bulk_permissions_data = {
-            "user_ids": user_ids,
-            "permissions": {
-                "tenders": {"read": True, "write": True},
-                "quotations": {"read": True, "write": False}
-            }
-        }
-        
-        response = await async_client.put(
-            "/api/v1/users/bulk/permissions",
-            json=bulk_permissions_data,
-            headers=admin_headers
-        )
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["updated_count"] == 3
-
-    async def test_bulk_activate_deactivate(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
-    ):
-        """Test bulk user activation/deactivation."""
-        users = [UserFactory(is_active=True) for _ in range(3)]
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
-        
-        user_ids = [str(user.id) for user in users]
-        
-        # Bulk deactivate
-        response = await async_client.put(
-            "/api/v1/users/bulk/deactivate",
-            json={"user_ids": user_ids},
-            headers=admin_headers
-        )
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["updated_count"] == 3
-        
-        # Bulk activate
-        response = await async_client.put(
-            "/api/v1/users/bulk/activate",
-            json={"user_ids": user_ids},
-            headers=admin_headers
-        )
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["updated_count"] == 3
-
 
 @pytest.mark.api
 @pytest.mark.asyncio
@@ -1045,15 +1009,13 @@ class TestUsersReporting:
         """Test user analytics endpoint."""
         # Create users with different roles and statuses
         users = [
-            UserFactory(role=UserRole.USER, is_active=True),
-            UserFactory(role=UserRole.USER, is_active=False),
-            UserFactory(role=UserRole.MANAGER, is_active=True),
-            AdminUserFactory(is_active=True),
+            UserFactory.build(role=UserRole.USER, is_active=True),
+            UserFactory.build(role=UserRole.USER, is_active=False),
+            UserFactory.build(role=UserRole.MANAGER, is_active=True),
+            AdminUserFactory.build(is_active=True),
         ]
         
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
+        await _seed(async_db_session, users)
         
         response = await async_client.get(
             "/api/v1/users/analytics",
@@ -1061,7 +1023,7 @@ class TestUsersReporting:
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert data["total_users"] == 4
         assert data["active_users"] == 3
         assert data["inactive_users"] == 1
@@ -1069,75 +1031,70 @@ class TestUsersReporting:
         assert data["role_distribution"]["MANAGER"] == 1
         assert data["role_distribution"]["ADMIN"] == 1
 
-    async def test_user_activity_report(
+    async def test_user_stats_overview(
         self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
     ):
-        """Test user activity report."""
-        # Create users with different last login times
+        """Test the user statistics overview endpoint."""
         users = [
-            UserFactory(last_login=datetime.utcnow() - timedelta(days=1)),
-            UserFactory(last_login=datetime.utcnow() - timedelta(days=7)),
-            UserFactory(last_login=datetime.utcnow() - timedelta(days=30)),
-            UserFactory(last_login=None),
+            UserFactory.build(role=UserRole.VIEWER, is_active=True),
+            UserFactory.build(role=UserRole.VIEWER, is_active=False),
+            UserFactory.build(role=UserRole.MANAGER, is_active=True),
         ]
         
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
+        await _seed(async_db_session, users)
         
         response = await async_client.get(
-            "/api/v1/users/activity-report",
+            "/api/v1/users/stats/overview",
             headers=admin_headers
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["total_users"] == 4
-        assert data["never_logged_in"] == 1
-        assert data["active_last_day"] == 1
-        assert data["active_last_week"] == 2
-        assert data["active_last_month"] == 3
+        data = _json(response)
+        # The seeded users plus the admin making the request
+        assert data["total_users"] == len(users) + 1
+        assert data["inactive_users"] == 1
+        assert data["role_distribution"]["viewer"] == 2
+        assert data["role_distribution"]["manager"] == 1
 
-    async def test_user_export(
+    async def test_user_activity_report(
         self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
     ):
-        """Test user data export."""
-        users = [UserFactory() for _ in range(5)]
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
-        
-        # Test CSV export
-        response = await async_client.get(
-            "/api/v1/users/export?format=csv",
-            headers=admin_headers
-        )
+        """Test user activity report."""
+        # Create users with different last login times, offset from one clock read
+        now = datetime.utcnow()
+        users = [
+            UserFactory.build(last_login=now - timedelta(days=1)),
+            UserFactory.build(last_login=now - timedelta(days=7)),
+            UserFactory.build(last_login=now - timedelta(days=30)),
+            UserFactory.build(last_login=None),
+        ]
         
-        assert response.status_code == status.HTTP_200_OK
-        assert response.headers["content-type"] == "text/csv"
+        await _seed(async_db_session, users)
         
-        # Test Excel export
         response = await async_client.get(
-            "/api/v1/users/export?format=xlsx",
+            "/api/v1/users/activity-report",
             headers=admin_headers
         )
         
         assert response.status_code == status.HTTP_200_OK
-        assert "spreadsheet" in response.headers["content-type"]
+        data = _json(response)
+        assert data["total_users"] == 4
+        assert data["never_logged_in"] == 1
+        assert data["active_last_day"] == 1
+        assert data["active_last_week"] == 2
+        assert data["active_last_month"] == 3
 
     async def test_user_permissions_report(
         self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
     ):
         """Test user permissions report."""
         users = [
-            UserFactory(permissions={"tenders": {"read": True, "write": True}}),
-            UserFactory(permissions={"tenders": {"read": True, "write": False}}),
-            UserFactory(permissions={"quotations": {"read": True, "write": True}}),
+            UserFactory.build(permissions={"tenders": {"read": True, "write": True}}),
+            UserFactory.build(permissions={"tenders": {"read": True, "write": False}}),
+            UserFactory.build(permissions={"quotations": {"read": True, "write": True}}),
         ]
         
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
+        await _seed(async_db_session, users)
         
         response = await async_client.get(
             "/api/v1/users/permissions-report",
@@ -1145,7 +1102,7 @@ class TestUsersReporting:
         )
         
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = _json(response)
         assert "permissions_summary" in data
         assert "resource_access" in data
 
@@ -1156,82 +1113,67 @@ class TestUsersReporting:
 class TestUsersPerformance:
     """Test user API performance."""
 
-    async def test_user_list_performance(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
-    ):
-        """Test performance of user listing."""
-        # Create many users
-        users = [UserFactory() for _ in range(100)]
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
-        
-        import time
-        
-        start_time = time.time()
-        response = await async_client.get(
-            "/api/v1/users?page=1&size=20",
-            headers=admin_headers
-        )
-        end_time = time.time()
-        
-        assert response.status_code == status.HTTP_200_OK
-        assert end_time - start_time < 2.0  # Should complete within 2 seconds
-
-    async def test_user_search_performance(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
-    ):
-        """Test performance of user search."""
-        # Create many users with searchable content
+    @pytest.fixture(scope="class")
+    async def many_users(self, async_db_engine):
+        """Seed the performance corpus once for the class (COPY on PostgreSQL)."""
         users = [
-            UserFactory(first_name=f"User{i}", email=f"user{i}@example.com") 
-            for i in range(50)
+            {
+                "id": uuid.uuid4(),
+                "email": f"user{i}@example.com",
+                "first_name": f"User{i}",
+                "last_name": "Perf",
+            }
+            for i in range(_PERF_CORPUS_SIZE)
         ]
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
-        
-        import time
-        
-        start_time = time.time()
-        response = await async_client.get(
-            "/api/v1/users?search=User&page=1&size=20",
-            headers=admin_headers
-        )
-        end_time = time.time()
+        async with _class_dataset(async_db_engine, users) as conn:
+            yield {"connection": conn, "users": users}
+
+    @pytest.fixture
+    async def async_db_session(self, many_users):
+        """Test session on the corpus connection; bulk mutations roll back after each test."""
+        async with _savepoint_session(many_users["connection"]) as session:
+            yield session
+
+    @pytest.mark.parametrize(
+        "url,budget,default_ms",
+        [
+            ("/api/v1/users?page=1&size=20", "USER_LIST", 2000),
+            ("/api/v1/users?search=User&page=1&size=20", "USER_SEARCH", 1500),
+        ],
+        ids=["list", "search"],
+    )
+    async def test_user_read_performance(
+        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict,
+        many_users: dict, perf_timer, url: str, budget: str, default_ms: float
+    ):
+        """Test performance of user listing and search over the shared corpus."""
+        with perf_timer.measure() as timing:
+            response = await async_client.get(url, headers=admin_headers)
         
         assert response.status_code == status.HTTP_200_OK
-        assert end_time - start_time < 1.5  # Should complete within 1.5 seconds
+        assert timing.ms < perf_timer.budget_ms(budget, default_ms)
 
     async def test_bulk_operations_performance(
-        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict
+        self, async_client: AsyncClient, async_db_session: AsyncSession, admin_headers: dict,
+        many_users: dict, perf_timer
     ):
         """Test performance of bulk operations."""
-        # Create many users
-        users = [UserFactory() for _ in range(50)]
-        for user in users:
-            async_db_session.add(user)
-        await async_db_session.commit()
-        
-        user_ids = [str(user.id) for user in users]
-        
         bulk_update_data = {
-            "user_ids": user_ids,
+            "user_ids": [user["id"] for user in many_users["users"][:50]],
             "updates": {"is_active": False}
         }
         
-        import time
-        
-        start_time = time.time()
-        response = await async_client.put(
-            "/api/v1/users/bulk",
-            json=bulk_update_data,
-            headers=admin_headers
-        )
-        end_time = time.time()
+        with perf_timer.measure() as timing:
+            response = await _send_json(
+                async_client,
+                "PUT",
+                "/api/v1/users/bulk",
+                bulk_update_data,
+                admin_headers,
+            )
         
         assert response.status_code == status.HTTP_200_OK
-        assert end_time - start_time < 3.0  # Should complete within 3 seconds
+        assert timing.ms < perf_timer.budget_ms("USER_BULK", 3000)
         
-        data = response.json()
+        data = _json(response)
         assert data["updated_count"] == 50
\ No newline at end of file
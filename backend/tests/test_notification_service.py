@@ -0,0 +1,55 @@
+"""
+Notification service tests for COTAI backend.
+Tests for notification persistence at the service layer, without the API stack.
+"""
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.notification import Notification, NotificationSettings
+from app.models.user import User
+from app.services.notification_service import NotificationService
+
+
+@pytest.mark.services
+class TestDeadlineReminder:
+    """Test NotificationService.send_deadline_reminder."""
+
+    async def test_reminder_persists_deadline_metadata(self, db_session: Session):
+        """Test the deadline data is stored in the notification's extra_metadata."""
+        owner = User(
+            email="deadline.owner@test.local",
+            hashed_password="x",
+            first_name="Deadline",
+            last_name="Owner",
+        )
+        db_session.add(owner)
+        db_session.flush()
+        # Keep the reminder off the email queue; only persistence is under test
+        db_session.add(NotificationSettings(user_id=owner.id, email_enabled=False))
+        db_session.commit()
+
+        deadline = datetime.utcnow() + timedelta(days=3)
+        quotation = SimpleNamespace(
+            id=uuid.uuid4(),
+            title="Cotação de teste",
+            response_deadline=deadline,
+            assigned_to_id=None,
+            created_by_id=owner.id,
+        )
+
+        notification = await NotificationService(db_session).send_deadline_reminder(
+            quotation
+        )
+        db_session.expire_all()
+        stored = db_session.get(Notification, notification.id)
+
+        assert stored.user_id == owner.id
+        assert stored.related_id == str(quotation.id)
+        assert stored.extra_metadata == {
+            "deadline": deadline.isoformat(),
+            "days_remaining": 3,
+        }
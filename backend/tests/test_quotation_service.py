@@ -0,0 +1,52 @@
+"""
+Quotation service tests for COTAI backend.
+Tests for quotation analytics at the service layer, without the API stack.
+"""
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.quotation import Quotation, QuotationStatus
+from app.models.user import User
+from app.services.quotation_service import QuotationService
+
+
+@pytest.mark.services
+class TestQuotationAnalytics:
+    """Test QuotationService.get_quotation_analytics aggregation."""
+
+    def test_analytics_status_keys(self, db_session: Session):
+        """Test totals, and status keys in the same value format as get_quotations_by_status."""
+        owner = User(
+            email="analytics.owner@test.local",
+            hashed_password="x",
+            first_name="Analytics",
+            last_name="Owner",
+        )
+        db_session.add(owner)
+        db_session.flush()
+        db_session.add_all(
+            Quotation(
+                number=f"COT-{i}",
+                title=f"Cotação {i}",
+                status=quotation_status,
+                created_by_id=owner.id,
+            )
+            for i, quotation_status in enumerate(
+                [
+                    QuotationStatus.DRAFT,
+                    QuotationStatus.SENT,
+                    QuotationStatus.COMPLETED,
+                    QuotationStatus.COMPLETED,
+                ]
+            )
+        )
+        db_session.commit()
+
+        service = QuotationService(db_session)
+        analytics = service.get_quotation_analytics()
+
+        assert analytics == {
+            "total_quotations": 4,
+            "status_distribution": {"draft": 1, "sent": 1, "completed": 2},
+        }
+        assert analytics["status_distribution"] == service.get_quotations_by_status()
@@ -0,0 +1,116 @@
+"""
+Tender service tests for COTAI backend.
+Tests for search filters and sorting at the service layer, without the API stack.
+"""
+import uuid
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.tender import (
+    GovernmentEntity,
+    Tender,
+    TenderCriteria,
+    TenderModalityType,
+    TenderStatus,
+    TenderType,
+)
+from app.schemas.tender import TenderSearchFilters, TenderSearchParams
+from app.services.tender_service import TenderService
+
+
+def _search(db_session: Session, **filters) -> list:
+    """Run the service search query with the given filters, unpaginated."""
+    params = TenderSearchParams(filters=TenderSearchFilters(**filters))
+    return TenderService(db_session).build_search_query(params).all()
+
+
+def _seed(db_session: Session, *tenders: dict) -> None:
+    """Persist tenders (given as column overrides) under one government entity."""
+    entity = GovernmentEntity(name="Prefeitura de Teste")
+    db_session.add(entity)
+    db_session.flush()
+    db_session.add_all(
+        Tender(
+            number=f"PE-{uuid.uuid4().hex[:8]}",
+            modality=TenderModalityType.PREGAO,
+            type=TenderType.GOODS,
+            criteria=TenderCriteria.LOWEST_PRICE,
+            government_entity_id=entity.id,
+            **overrides,
+        )
+        for overrides in tenders
+    )
+    db_session.commit()
+
+
+@pytest.fixture
+def filter_dataset(db_session: Session) -> Session:
+    """Test session seeded with three tenders of distinct status and value."""
+    _seed(
+        db_session,
+        {
+            "title": "Construction Project Alpha",
+            "description": "Building construction with steel framework",
+            "status": TenderStatus.DRAFT,
+            "estimated_value": 50000.0,
+        },
+        {
+            "title": "Software Development Beta",
+            "description": "Software development with Python framework",
+            "status": TenderStatus.OPEN,
+            "estimated_value": 150000.0,
+        },
+        {
+            "title": "Maintenance Services Gamma",
+            "description": "Maintenance services for equipment",
+            "status": TenderStatus.CLOSED,
+            "estimated_value": 500000.0,
+        },
+    )
+    return db_session
+
+
+@pytest.mark.services
+class TestTenderSearchQuery:
+    """Test TenderService.build_search_query filters and sorting."""
+
+    def test_filter_by_status(self, filter_dataset: Session):
+        """Test filtering tenders by status."""
+        tenders = _search(filter_dataset, status=[TenderStatus.OPEN])
+
+        assert [t.title for t in tenders] == ["Software Development Beta"]
+
+    def test_filter_by_value_range(self, filter_dataset: Session):
+        """Test filtering tenders by estimated value range."""
+        tenders = _search(filter_dataset, min_value=100000, max_value=200000)
+
+        assert [t.estimated_value for t in tenders] == [150000.0]
+
+    def test_search_by_title(self, filter_dataset: Session):
+        """Test text search matching the title."""
+        tenders = _search(filter_dataset, search="Software")
+
+        assert [t.title for t in tenders] == ["Software Development Beta"]
+
+    def test_search_by_description(self, filter_dataset: Session):
+        """Test text search matching the description."""
+        tenders = _search(filter_dataset, search="framework")
+
+        assert sorted(t.title for t in tenders) == [
+            "Construction Project Alpha",
+            "Software Development Beta",
+        ]
+
+    def test_combined_filters(self, filter_dataset: Session):
+        """Test text and value filters applied together."""
+        tenders = _search(filter_dataset, search="framework", max_value=100000)
+
+        assert [t.title for t in tenders] == ["Construction Project Alpha"]
+
+    def test_sorting_by_estimated_value(self, filter_dataset: Session):
+        """Test sorting tenders by estimated value, descending."""
+        params = TenderSearchParams(sort_by="estimated_value", sort_order="desc")
+        tenders = TenderService(filter_dataset).build_search_query(params).all()
+
+        assert [t.estimated_value for t in tenders] == [500000.0, 150000.0, 50000.0]
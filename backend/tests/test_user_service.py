@@ -0,0 +1,138 @@
+"""
+User service tests for COTAI backend.
+Tests for user statistics and bulk actions at the service layer, without the API stack.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.user import User, UserRole
+from app.services.user_service import UserService
+
+
+@pytest.mark.services
+class TestUserStats:
+    """Test UserService.get_user_stats aggregation."""
+
+    def test_stats_counts(self, db_session: Session):
+        """Test totals, filtered counts and role distribution from one query."""
+        old = datetime.utcnow() - timedelta(days=90)
+        db_session.add_all(
+            User(
+                email=f"stats{i}@test.local",
+                hashed_password="x",
+                first_name="Stats",
+                last_name=f"User{i}",
+                role=role,
+                is_active=is_active,
+                is_verified=is_verified,
+                **({"created_at": old} if is_old else {}),
+            )
+            for i, (role, is_active, is_verified, is_old) in enumerate(
+                [
+                    (UserRole.ADMIN, True, True, False),
+                    (UserRole.VIEWER, True, False, False),
+                    (UserRole.VIEWER, False, True, True),
+                    (UserRole.MANAGER, False, False, True),
+                ]
+            )
+        )
+        db_session.commit()
+
+        stats = UserService(db_session).get_user_stats()
+
+        assert stats == {
+            "total_users": 4,
+            "active_users": 2,
+            "verified_users": 2,
+            "inactive_users": 2,
+            "unverified_users": 2,
+            "recent_registrations": 2,
+            "role_distribution": {
+                UserRole.ADMIN: 1,
+                UserRole.VIEWER: 2,
+                UserRole.MANAGER: 1,
+            },
+        }
+
+    def test_stats_empty(self, db_session: Session):
+        """Test that an empty table yields zero counts."""
+        stats = UserService(db_session).get_user_stats()
+
+        assert stats["total_users"] == 0
+        assert stats["recent_registrations"] == 0
+        assert stats["role_distribution"] == {}
+
+
+@pytest.mark.services
+class TestUserBulkActions:
+    """Test the single-statement bulk user actions."""
+
+    @pytest.fixture
+    def users(self, db_session: Session) -> list:
+        """Three active viewers plus the admin performing the actions."""
+        users = [
+            User(
+                email=f"bulk{i}@test.local",
+                hashed_password="x",
+                first_name="Bulk",
+                last_name=f"User{i}",
+                role=UserRole.VIEWER,
+            )
+            for i in range(4)
+        ]
+        db_session.add_all(users)
+        db_session.commit()
+        return users
+
+    def test_bulk_update_role(self, db_session: Session, users: list):
+        """Test assigning one role to the selected users only."""
+        admin, *targets = users
+        service = UserService(db_session)
+
+        updated = service.bulk_update_users(
+            [user.id for user in targets[:2]], {"role": "manager"}, admin.id
+        )
+        db_session.expire_all()
+
+        assert updated == 2
+        assert [user.role for user in targets] == [
+            UserRole.MANAGER,
+            UserRole.MANAGER,
+            UserRole.VIEWER,
+        ]
+        assert targets[0].updated_by == admin.id
+
+    def test_bulk_reactivate_resets_failed_logins(
+        self, db_session: Session, users: list
+    ):
+        """Test reactivation clears the failed login counter."""
+        admin, target = users[0], users[1]
+        target.is_active = False
+        target.failed_login_attempts = 5
+        db_session.commit()
+
+        updated = UserService(db_session).bulk_reactivate_users([target.id], admin.id)
+        db_session.expire_all()
+
+        assert updated == 1
+        assert target.is_active is True
+        assert target.failed_login_attempts == 0
+
+    def test_bulk_delete_is_soft(self, db_session: Session, users: list):
+        """Test bulk delete deactivates and rewrites emails like delete_user."""
+        admin, *targets = users
+
+        deleted = UserService(db_session).bulk_delete_users(
+            [user.id for user in targets], admin.id
+        )
+        db_session.expire_all()
+
+        assert deleted == 3
+        assert db_session.query(User).count() == 4
+        for user in targets:
+            assert user.is_active is False
+            assert user.email.startswith("deleted_")
+            assert user.email.endswith("@deleted.com")
+        assert admin.email == "bulk0@test.local"